@@ -4,7 +4,6 @@
 # pylint: disable=too-many-arguments,too-many-positional-arguments
 import datetime
 
-from ska_ser_jira_checks.checks.utils import get_assignee
 from ska_ser_jira_checks.models import Check, ProjectCheckContext, Report
 
 
@@ -48,18 +47,15 @@ class IssuesNotTooOldCheck(Check):
         :param include_epics: Whether to include Epics in the check.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
-        now = datetime.datetime.now(datetime.timezone.utc)
+        issues_by_status = context.index.by_status
+        now = context.now
         deadline = now - datetime.timedelta(days=age_limit)
 
         for issue in issues_by_status.get(status, []):
-            if issue.fields.issuetype.name == "Epic" and not include_epics:
+            if not include_epics and issue.fields.issuetype.name == "Epic":
                 continue
 
-            updated = datetime.datetime.strptime(
-                issue.fields.updated, "%Y-%m-%dT%H:%M:%S.%f%z"
-            )
-
+            updated = context.index.updated[issue.key]
             if updated < deadline:
                 report.add_violation(
                     check_name=f"too_old_{status}",
@@ -68,6 +64,6 @@ class IssuesNotTooOldCheck(Check):
                     details={
                         "status": status,
                         "age_days": (now - updated).days,
-                        "assignee": get_assignee(issue),
+                        "assignee": context.index.assignee_by_key[issue.key],
                     },
                 )
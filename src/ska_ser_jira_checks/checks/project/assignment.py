@@ -1,9 +1,6 @@
 """Assignment checks for Jira issues."""
 
 # pylint: disable=too-few-public-methods,arguments-differ
-from collections import defaultdict
-
-from ska_ser_jira_checks.checks.utils import get_assignee
 from ska_ser_jira_checks.models import Check, ProjectCheckContext, Report
 
 
@@ -29,7 +26,7 @@ class TicketsHaveAssigneeCheck(Check):
         :param status: The status to check.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
+        issues_by_status = context.index.by_status
         for issue in issues_by_status.get(status, []):
             if not issue.fields.assignee:
                 report.add_violation(
@@ -55,17 +52,10 @@ class NoOneHasTooMuchWipCheck(Check):
         :param max_wip: The maximum number of issues in progress allowed.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
-        in_progress = issues_by_status.get("In Progress", [])
-        by_assignee = defaultdict(list)
-        for issue in in_progress:
-            if issue.fields.issuetype.name == "Epic":
-                continue
-            assignee = get_assignee(issue)
-            if assignee != "UNASSIGNED":
-                by_assignee[assignee].append(issue)
-
+        by_assignee = context.index.by_status_and_assignee.get("In Progress", {})
         for assignee, assignee_issues in by_assignee.items():
+            if assignee == "UNASSIGNED":
+                continue
             if len(assignee_issues) > max_wip:
                 report.add_violation(
                     check_name="too_much_wip",
@@ -100,17 +90,10 @@ class NoOneHasTooMuchBlockedCheck(Check):
         :param max_blocked: The maximum number of blocked issues allowed.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
-        blocked = issues_by_status.get("BLOCKED", [])
-        by_assignee = defaultdict(list)
-        for issue in blocked:
-            if issue.fields.issuetype.name == "Epic":
-                continue
-            assignee = get_assignee(issue)
-            if assignee != "UNASSIGNED":
-                by_assignee[assignee].append(issue)
-
+        by_assignee = context.index.by_status_and_assignee.get("BLOCKED", {})
         for assignee, assignee_issues in by_assignee.items():
+            if assignee == "UNASSIGNED":
+                continue
             if len(assignee_issues) > max_blocked:
                 report.add_violation(
                     check_name="too_much_blocked",
@@ -153,13 +136,18 @@ class TicketsAreAssignedWithinTeamCheck(Check):
         :param status: The status to check.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
+        issues_by_status = context.index.by_status
         team = context.team
         if not team:
             return
 
+        # Only walk the issues if someone outside the team is assigned one
+        assignees = context.index.assignees_by_status.get(status, set())
+        if not assignees.difference(team, ["UNASSIGNED"]):
+            return
+
         for issue in issues_by_status.get(status, []):
-            assignee = get_assignee(issue)
+            assignee = context.index.assignee_by_key[issue.key]
             if assignee != "UNASSIGNED" and assignee not in team:
                 report.add_violation(
                     check_name=f"misassigned_{status}",
@@ -181,19 +169,12 @@ class EveryoneHasATicketInProgressCheck(Check):
         :param context: The context containing issue data.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
         team = context.team
         if not team:
             return
 
-        in_progress = issues_by_status.get("In Progress", [])
-        assignees_in_progress = {
-            get_assignee(issue)
-            for issue in in_progress
-            if issue.fields.issuetype.name != "Epic"
-        }
-
-        unassigned_members = team - assignees_in_progress
+        by_assignee = context.index.by_status_and_assignee.get("In Progress", {})
+        unassigned_members = team.difference(by_assignee)
         for member in unassigned_members:
             report.add_violation(
                 check_name="no_wip_for_member",
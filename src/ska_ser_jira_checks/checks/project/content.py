@@ -1,7 +1,7 @@
 """Content checks for Jira issues."""
 
 # pylint: disable=too-few-public-methods,arguments-differ
-from ska_ser_jira_checks.checks.utils import get_assignee, get_fix_versions
+from ska_ser_jira_checks.checks.utils import has_fix_version
 from ska_ser_jira_checks.models import Check, ProjectCheckContext, Report
 
 
@@ -28,7 +28,7 @@ class IssuesHaveDescriptionCheck(Check):
         :param status: The status to check.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
+        issues_by_status = context.index.by_status
         for issue in issues_by_status.get(status, []):
             if not issue.fields.description:
                 report.add_violation(
@@ -65,7 +65,7 @@ class IssuesHaveFixVersionCheck(Check):
         :param status: The status to check.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
+        issues_by_status = context.index.by_status
         for issue in issues_by_status.get(status, []):
             if not issue.fields.fixVersions:
                 report.add_violation(
@@ -101,19 +101,21 @@ class NoIssuesWithOldFixVersionCheck(Check):
         """
         pi = context.pi
         current_pi = f"PI{pi}"
-        issues_by_status = context.issues_by_status
+        issues_by_status = context.index.by_status
 
         for issue in issues_by_status.get(status, []):
-            fix_versions = get_fix_versions(issue)
-            if not fix_versions:
+            if not issue.fields.fixVersions:
                 continue
 
-            if current_pi in fix_versions:
+            if has_fix_version(issue, current_pi):
                 continue
 
             report.add_violation(
                 check_name=f"old_fix_version_{status}",
                 issue_key=issue.key,
                 summary=issue.fields.summary,
-                details={"status": status, "assignee": get_assignee(issue)},
+                details={
+                    "status": status,
+                    "assignee": context.index.assignee_by_key[issue.key],
+                },
             )
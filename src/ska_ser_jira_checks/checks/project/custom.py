@@ -1,7 +1,6 @@
 """Custom team-specific checks for Jira issues."""
 
 # pylint: disable=too-few-public-methods
-from ska_ser_jira_checks.checks.utils import get_fix_versions
 from ska_ser_jira_checks.models import Check, ProjectCheckContext, Report
 
 
@@ -21,7 +20,7 @@ class NoRfaIssuesAssignedToAlexCheck(Check):
         if context.project != "LOW":
             return
 
-        issues_by_status = context.issues_by_status
+        issues_by_status = context.index.by_status
         rfa_issues = issues_by_status.get("READY FOR ACCEPTANCE", [])
         for issue in rfa_issues:
             if (
@@ -51,13 +50,8 @@ class IssuesInThisPiHaveAcceptableTypesCheck(Check):
         :param kwargs: Additional parameters for the check.
         """
         acceptable_types = ["Story", "Enabler", "Spike", "Bug", "Epic"]
-        current_pi = f"PI{context.pi}"
-
-        for issues in context.issues_by_status.values():
+        for issues in context.index.pi_by_status.values():
             for issue in issues:
-                fix_versions = get_fix_versions(issue)
-                if current_pi not in fix_versions:
-                    continue
                 if issue.fields.issuetype.name in acceptable_types:
                     continue
 
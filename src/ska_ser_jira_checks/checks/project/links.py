@@ -1,11 +1,8 @@
 """Link checks for Jira issues."""
 
 # pylint: disable=too-few-public-methods,arguments-differ
-# pylint: disable=too-many-nested-blocks
-import functools
-
-from ska_ser_jira_checks.checks.utils import get_fix_versions
-from ska_ser_jira_checks.constants import UNLINKED_LABELS
+from ska_ser_jira_checks.checks.utils import has_fix_version
+from ska_ser_jira_checks.constants import PARENT_ISSUE_FIELDS
 from ska_ser_jira_checks.models import Check, ProjectCheckContext, Report
 
 
@@ -21,19 +18,13 @@ class NoIssuesAreChildOfAnObjectiveCheck(Check):
         :param context: The context containing issue data.
         :param kwargs: Additional parameters for the check.
         """
-        for issues in context.issues_by_status.values():
-            for issue in issues:
-                for issuelink in issue.fields.issuelinks:
-                    if issuelink.type.name == "Parent/Child":
-                        if hasattr(issuelink, "inwardIssue"):
-                            inward = str(issuelink.inwardIssue)
-                            if inward.startswith("SPO-"):
-                                report.add_violation(
-                                    check_name="child_of_objective",
-                                    issue_key=issue.key,
-                                    summary=issue.fields.summary,
-                                    details={"objective": inward},
-                                )
+        for issue, objective in context.links.objective_children:
+            report.add_violation(
+                check_name="child_of_objective",
+                issue_key=issue.key,
+                summary=issue.fields.summary,
+                details={"objective": objective},
+            )
 
 
 class NoIssuesRelateToAFeatureCheck(Check):
@@ -48,29 +39,13 @@ class NoIssuesRelateToAFeatureCheck(Check):
         :param context: The context containing issue data.
         :param kwargs: Additional parameters for the check.
         """
-        for issues in context.issues_by_status.values():
-            for issue in issues:
-                for issuelink in issue.fields.issuelinks:
-                    if issuelink.type.name != "Relates":
-                        continue
-                    if hasattr(issuelink, "inwardIssue"):
-                        inward = str(issuelink.inwardIssue)
-                        if inward.startswith("SP-"):
-                            report.add_violation(
-                                check_name="relates_to_feature",
-                                issue_key=issue.key,
-                                summary=issue.fields.summary,
-                                details={"feature": inward},
-                            )
-                    elif hasattr(issuelink, "outwardIssue"):
-                        outward = str(issuelink.outwardIssue)
-                        if outward.startswith("SP-"):
-                            report.add_violation(
-                                check_name="relates_to_feature",
-                                issue_key=issue.key,
-                                summary=issue.fields.summary,
-                                details={"feature": outward},
-                            )
+        for issue, feature in context.links.related_features:
+            report.add_violation(
+                check_name="relates_to_feature",
+                issue_key=issue.key,
+                summary=issue.fields.summary,
+                details={"feature": feature},
+            )
 
 
 class IssuesInThisPiAreLinkedCheck(Check):
@@ -101,18 +76,9 @@ class IssuesInThisPiAreLinkedCheck(Check):
         :param status: The status to check.
         :param kwargs: Additional parameters for the check.
         """
-        current_pi = f"PI{context.pi}"
-        issues_by_status = context.issues_by_status
-        parentage = context.parentage
-
-        for issue in issues_by_status.get(status, []):
-            fix_versions = get_fix_versions(issue)
-            if current_pi not in fix_versions:
-                continue
-            lower_labels = {label.lower() for label in issue.fields.labels}
-            if lower_labels.intersection(UNLINKED_LABELS):
-                continue
+        parentage = context.links.parentage
 
+        for issue in context.index.linkable_pi_by_status.get(status, []):
             if issue.key not in parentage:
                 report.add_violation(
                     check_name=f"unlinked_{status}",
@@ -150,28 +116,18 @@ class IssuesInThisPiHaveParentInThisPiCheck(Check):
         :param kwargs: Additional parameters for the check.
         """
         current_pi = f"PI{context.pi}"
-        issues_by_status = context.issues_by_status
-        parentage = context.parentage
+        parentage = context.links.parentage
         client = context.client
 
-        @functools.lru_cache
-        def is_in_this_pi(issue_key):
-            parent_issue = client.get_issue(issue_key)
-            fix_versions = get_fix_versions(parent_issue)
-            return current_pi in fix_versions
-
-        for issue in issues_by_status.get(status, []):
-            fix_versions = get_fix_versions(issue)
-            if current_pi not in fix_versions:
-                continue
-            lower_labels = {label.lower() for label in issue.fields.labels}
-            if lower_labels.intersection(UNLINKED_LABELS):
-                continue
-            if issue.key not in parentage:
+        for issue in context.index.linkable_pi_by_status.get(status, []):
+            parents = parentage.get(issue.key)
+            if not parents:
                 continue
 
-            for _, link_target in parentage[issue.key]:
-                if is_in_this_pi(link_target):
+            for _, link_target in parents:
+                if has_fix_version(
+                    client.get_issue(link_target, PARENT_ISSUE_FIELDS), current_pi
+                ):
                     break
             else:
                 report.add_violation(
@@ -258,22 +214,22 @@ class StatusIsConsistentWithParentStatusCheck(Check):
         :param consistent_parent_statuses: A list of consistent parent statuses.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
-        parentage = context.parentage
+        issues_by_status = context.index.by_status
+        parentage = context.links.parentage
         client = context.client
-
-        @functools.lru_cache
-        def get_parent_status(issue_key):
-            parent_issue = client.get_issue(issue_key)
-            return parent_issue.fields.status.name
+        consistent_parent_statuses = frozenset(consistent_parent_statuses)
 
         for issue in issues_by_status.get(status, []):
-            if issue.key not in parentage:
+            parents = parentage.get(issue.key)
+            if not parents:
                 continue
 
             inconsistent_parents = []
-            for _, parent_key in parentage[issue.key]:
-                if get_parent_status(parent_key) not in consistent_parent_statuses:
+            for _, parent_key in parents:
+                parent_status = client.get_issue(
+                    parent_key, PARENT_ISSUE_FIELDS
+                ).fields.status.name
+                if parent_status not in consistent_parent_statuses:
                     inconsistent_parents.append(parent_key)
             if inconsistent_parents:
                 report.add_violation(
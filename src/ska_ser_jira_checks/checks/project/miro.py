@@ -1,7 +1,7 @@
 """Miro board checks for Jira issues."""
 
 # pylint: disable=too-few-public-methods
-# pylint: disable=too-many-locals, too-many-branches
+# pylint: disable=too-many-locals
 import os
 
 import requests
@@ -34,18 +34,15 @@ class MiroBoardCheck(Check):
         pi_str = f"PI{context.pi}"
 
         # Original code used PROJECT and PI in JQL, but here issues
-        # are already fetched. Filter for the current PI as a fixVersion.
+        # are already fetched and grouped for the current PI.
         relevant_issues = []
-        for status, status_issues in context.issues_by_status.items():
+        for status, status_issues in context.index.pi_by_status.items():
             if status == "Discarded":
                 continue
             for issue in status_issues:
-                if issue.fields.issuetype.name == "Epic" and not include_epics:
+                if not include_epics and issue.fields.issuetype.name == "Epic":
                     continue
-
-                fix_versions = {v.name for v in issue.fields.fixVersions}
-                if pi_str in fix_versions:
-                    relevant_issues.append(issue)
+                relevant_issues.append(issue)
 
         if not relevant_issues:
             return
@@ -1,7 +1,6 @@
 """Points checks for Jira issues."""
 
 # pylint: disable=too-few-public-methods,arguments-differ
-from ska_ser_jira_checks.checks.utils import get_fix_versions
 from ska_ser_jira_checks.models import Check, ProjectCheckContext, Report
 
 
@@ -33,17 +32,13 @@ class IssuesInThisPiHavePointsCheck(Check):
         :param kwargs: Additional parameters for the check.
         """
         current_pi = f"PI{context.pi}"
-        issues_in_status = context.issues_by_status.get(status, [])
+        issues_in_status = context.index.pi_by_status.get(status, [])
         issue_types_to_check = ["Story", "Enabler", "Spike"]
 
         for issue in issues_in_status:
             if issue.fields.issuetype.name not in issue_types_to_check:
                 continue
 
-            fix_versions = get_fix_versions(issue)
-            if current_pi not in fix_versions:
-                continue
-
             # Story points is customfield_10002
             story_points = getattr(issue.fields, "customfield_10002", None)
 
@@ -1,7 +1,7 @@
 """RFA checks for Jira issues."""
 
 # pylint: disable=too-few-public-methods,arguments-differ
-from ska_ser_jira_checks.checks.utils import get_assignee, get_dev_field
+from ska_ser_jira_checks.checks.utils import get_dev_field
 from ska_ser_jira_checks.models import Check, ProjectCheckContext, Report
 
 
@@ -17,7 +17,7 @@ class RfaIssuesHaveOutcomesCheck(Check):
         :param context: The context containing issue data.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
+        issues_by_status = context.index.by_status
         rfa_issues = issues_by_status.get("READY FOR ACCEPTANCE", [])
         for issue in rfa_issues:
             if issue.fields.issuetype.name == "Bug":
@@ -27,7 +27,7 @@ class RfaIssuesHaveOutcomesCheck(Check):
                     check_name="rfa_no_outcomes",
                     issue_key=issue.key,
                     summary=issue.fields.summary,
-                    details={"assignee": get_assignee(issue)},
+                    details={"assignee": context.index.assignee_by_key[issue.key]},
                 )
 
 
@@ -50,7 +50,7 @@ class NoActiveIssuesHaveOnlyClosedMergeRequestsCheck(Check):
         :param status: The status to check.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
+        issues_by_status = context.index.by_status
         for issue in issues_by_status.get(status, []):
             if issue.fields.issuetype.name == "Epic":
                 continue
@@ -71,7 +71,10 @@ class NoActiveIssuesHaveOnlyClosedMergeRequestsCheck(Check):
                     check_name=f"active_with_only_closed_mrs_{status}",
                     issue_key=issue.key,
                     summary=issue.fields.summary,
-                    details={"status": status, "assignee": get_assignee(issue)},
+                    details={
+                        "status": status,
+                        "assignee": context.index.assignee_by_key[issue.key],
+                    },
                 )
 
 
@@ -93,7 +96,7 @@ class NoRfaOrDoneIssuesHaveOpenMergeRequestsCheck(Check):
         :param status: The status to check.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
+        issues_by_status = context.index.by_status
         for issue in issues_by_status.get(status, []):
             dev_field = get_dev_field(issue)
             if not dev_field:
@@ -111,7 +114,10 @@ class NoRfaOrDoneIssuesHaveOpenMergeRequestsCheck(Check):
                     check_name=f"rfa_or_done_with_open_mrs_{status}",
                     issue_key=issue.key,
                     summary=issue.fields.summary,
-                    details={"status": status, "assignee": get_assignee(issue)},
+                    details={
+                        "status": status,
+                        "assignee": context.index.assignee_by_key[issue.key],
+                    },
                 )
 
 
@@ -130,7 +136,7 @@ class NotTooManyRfaIssuesCheck(Check):
         :param max_rfa: The maximum number of RFA issues allowed.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
+        issues_by_status = context.index.by_status
         rfa_issues = issues_by_status.get("READY FOR ACCEPTANCE", [])
         if len(rfa_issues) > max_rfa:
             report.add_violation(
@@ -143,7 +149,7 @@ class NotTooManyRfaIssuesCheck(Check):
                         {
                             "key": issue.key,
                             "summary": issue.fields.summary,
-                            "assignee": get_assignee(issue),
+                            "assignee": context.index.assignee_by_key[issue.key],
                         }
                         for issue in rfa_issues
                     ],
@@ -169,7 +175,7 @@ class NoTodoOrBacklogIssueWithCommitsCheck(Check):
         :param status: The status to check.
         :param kwargs: Additional parameters for the check.
         """
-        issues_by_status = context.issues_by_status
+        issues_by_status = context.index.by_status
         for issue in issues_by_status.get(status, []):
             dev_field = get_dev_field(issue)
             if not dev_field:
@@ -186,5 +192,8 @@ class NoTodoOrBacklogIssueWithCommitsCheck(Check):
                     check_name=f"todo_or_backlog_with_commits_{status}",
                     issue_key=issue.key,
                     summary=issue.fields.summary,
-                    details={"status": status, "assignee": get_assignee(issue)},
+                    details={
+                        "status": status,
+                        "assignee": context.index.assignee_by_key[issue.key],
+                    },
                 )
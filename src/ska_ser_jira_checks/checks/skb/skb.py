@@ -3,10 +3,13 @@
 # pylint: disable=too-few-public-methods,arguments-differ
 # pylint: disable=too-many-arguments,too-many-positional-arguments
 import datetime
-import functools
 
-from ska_ser_jira_checks.checks.utils import get_assignee, get_fix_versions
-from ska_ser_jira_checks.constants import UNLINKED_LABELS
+from ska_ser_jira_checks.checks.utils import (
+    get_assignee,
+    has_fix_version,
+    has_unlinked_label,
+)
+from ska_ser_jira_checks.constants import PARENT_ISSUE_FIELDS
 from ska_ser_jira_checks.models import Check, Report, SkbCheckContext
 
 
@@ -29,9 +32,7 @@ class SkbsHaveComponentCheck(Check):
         :param status: The status to check.
         :param kwargs: Additional parameters for the check.
         """
-        for issue in context.team_created_skbs:
-            if issue.fields.status.name != status:
-                continue
+        for issue in context.team_created_skbs_by_status.get(status, []):
             if not issue.fields.components:
                 report.add_violation(
                     check_name=f"skb_no_component_{status}",
@@ -104,18 +105,14 @@ class SkbNotTooOldCheck(Check):
         :param priority: The priority to check.
         :param kwargs: Additional parameters for the check.
         """
-        now = datetime.datetime.now(datetime.timezone.utc)
+        now = context.now
         deadline = now - datetime.timedelta(days=age_limit)
 
-        for issue in context.team_assigned_skbs:
-            if issue.fields.status.name != status:
-                continue
+        for issue in context.team_assigned_skbs_by_status.get(status, []):
             if issue.fields.priority.name != priority:
                 continue
 
-            updated = datetime.datetime.strptime(
-                issue.fields.updated, "%Y-%m-%dT%H:%M:%S.%f%z"
-            )
+            updated = context.updated[issue.key]
             if updated < deadline:
                 report.add_violation(
                     check_name=f"skb_too_old_{status}_{priority}",
@@ -158,47 +155,18 @@ class SkbsLinkedToPiFeatureOrObjectiveCheck(Check):
         """
         current_pi = f"PI{context.pi}"
         client = context.client
+        parentage = context.parentage
 
-        @functools.lru_cache
-        def is_in_this_pi(issue_key):
-            parent_issue = client.get_issue(issue_key)
-            fix_versions = get_fix_versions(parent_issue)
-            return current_pi in fix_versions
-
-        for issue in context.team_assigned_skbs:
-            if issue.fields.status.name != status:
+        for issue in context.team_assigned_skbs_by_status.get(status, []):
+            if has_unlinked_label(issue):
                 continue
-            lower_labels = {label.lower() for label in issue.fields.labels}
-            if lower_labels.intersection(UNLINKED_LABELS):
-                continue
-
-            linked = False
-            for issuelink in issue.fields.issuelinks:
-                if (
-                    issuelink.type.name == "Parent/Child"
-                    and hasattr(issuelink, "inwardIssue")
-                    and str(issuelink.inwardIssue).startswith("SP-")
-                    and is_in_this_pi(str(issuelink.inwardIssue))
-                ):
-                    linked = True
-                    break
-
-                if issuelink.type.name == "Relates":
-                    if (
-                        hasattr(issuelink, "inwardIssue")
-                        and str(issuelink.inwardIssue).startswith("SPO-")
-                        and is_in_this_pi(str(issuelink.inwardIssue))
-                    ):
-                        linked = True
-                        break
-                    if (
-                        hasattr(issuelink, "outwardIssue")
-                        and str(issuelink.outwardIssue).startswith("SPO-")
-                        and is_in_this_pi(str(issuelink.outwardIssue))
-                    ):
-                        linked = True
-                        break
 
+            linked = any(
+                has_fix_version(
+                    client.get_issue(parent, PARENT_ISSUE_FIELDS), current_pi
+                )
+                for _, parent in parentage.get(issue.key, [])
+            )
             if not linked:
                 report.add_violation(
                     check_name=f"skb_not_linked_to_pi_{status}",
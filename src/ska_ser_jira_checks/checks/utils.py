@@ -1,23 +1,27 @@
 """Utility functions for checks."""
 
-import json
+import datetime
 from collections import defaultdict
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
+import orjson
 
-def get_issues_by_status(issues: List[Any]) -> Dict[str, List[Any]]:
+from ska_ser_jira_checks.constants import LINK_CATEGORIES, UNLINKED_LABELS
+from ska_ser_jira_checks.models import IssueIndex
+
+
+def parse_jira_datetime(value: str) -> datetime.datetime:
     """
-    Group issues by status.
+    Parse a timestamp string returned by Jira.
 
-    :param issues: The list of Jira issues.
+    :param value: The timestamp string, e.g. "2024-01-31T09:15:00.000+0000".
 
-    :return: A dictionary of issues keyed by status.
+    :return: The timezone-aware datetime.
     """
-    issues_by_status = defaultdict(list)
-    for issue in issues:
-        status = issue.fields.status.name
-        issues_by_status[status].append(issue)
-    return dict(issues_by_status)
+    # Before Python 3.11, fromisoformat needs a colon in the UTC offset
+    if value[-5] in "+-":
+        value = f"{value[:-2]}:{value[-2:]}"
+    return datetime.datetime.fromisoformat(value)
 
 
 def get_dev_field(issue: Any) -> Dict[str, Any]:
@@ -32,12 +36,11 @@ def get_dev_field(issue: Any) -> Dict[str, Any]:
     if not raw_dev_field:
         return {}
 
-    index = raw_dev_field.find("devSummaryJson=")
-    if index == -1:
+    _, found, json_bit = raw_dev_field.partition("devSummaryJson=")
+    if not found:
         return {}
 
-    json_bit = raw_dev_field[index + len("devSummaryJson=") : -1]
-    return json.loads(json_bit)
+    return orjson.loads(json_bit[:-1])
 
 
 def get_fix_versions(issue: Any) -> set[str]:
@@ -51,6 +54,53 @@ def get_fix_versions(issue: Any) -> set[str]:
     return {version.name for version in issue.fields.fixVersions}
 
 
+def has_fix_version(issue: Any, version: str) -> bool:
+    """
+    Check whether a Jira issue has a given fix version.
+
+    :param issue: The Jira issue.
+    :param version: The fix version name, e.g. "PI25".
+
+    :return: True if the issue has the fix version.
+    """
+    return any(v.name == version for v in issue.fields.fixVersions)
+
+
+def has_unlinked_label(issue: Any) -> bool:
+    """
+    Check whether a Jira issue has a label exempting it from link checks.
+
+    :param issue: The Jira issue.
+
+    :return: True if any of the issue's labels is in UNLINKED_LABELS.
+    """
+    return any(label.lower() in UNLINKED_LABELS for label in issue.fields.labels)
+
+
+def classify_issue_links(issue: Any) -> Iterator[tuple[str, str, str]]:
+    """
+    Classify the links of a Jira issue according to LINK_CATEGORIES.
+
+    :param issue: The Jira issue.
+
+    :yields: A (category, link type, linked issue key) tuple
+        for each link that falls into a category.
+    """
+    for issuelink in issue.fields.issuelinks:
+        direction = "outward"
+        target = getattr(issuelink, "outwardIssue", None)
+        if target is None:
+            direction = "inward"
+            target = getattr(issuelink, "inwardIssue", None)
+            if target is None:
+                continue
+        target = target.key
+        link_type = issuelink.type.name
+        category = LINK_CATEGORIES.get((direction, link_type, target.partition("-")[0]))
+        if category is not None:
+            yield category, link_type, target
+
+
 def get_assignee(issue: Any) -> str:
     """
     Get the assignee name or "UNASSIGNED".
@@ -59,12 +109,61 @@ def get_assignee(issue: Any) -> str:
 
     :return: The assignee name or "UNASSIGNED".
     """
-    return (
-        issue.fields.assignee.name
-        if issue.fields.assignee
-        else (
-            issue.fields.creator.name
-            if hasattr(issue.fields, "creator")
-            else "UNASSIGNED"
-        )
+    fields = issue.fields
+    assignee = fields.assignee
+    if assignee:
+        return assignee.name
+    if hasattr(fields, "creator"):
+        return fields.creator.name
+    return "UNASSIGNED"
+
+
+def index_issues(issues: List[Any], pi: int) -> IssueIndex:
+    """
+    Index issues by status, last-updated time and assignee in a single pass.
+
+    Issues with the current PI as a fix version are also grouped by status
+    separately, along with just those of them without an unlinked label.
+    Only non-Epic issues are indexed by assignee, but the set of assignees
+    in each status includes Epic assignees.
+
+    :param issues: The list of Jira issues.
+    :param pi: The current PI number.
+
+    :return: The issue index.
+    """
+    current_pi = f"PI{pi}"
+    by_status = defaultdict(list)
+    pi_by_status = defaultdict(list)
+    updated = {}
+    by_status_and_assignee = defaultdict(lambda: defaultdict(list))
+    assignees_by_status = defaultdict(set)
+    linkable_pi_by_status = defaultdict(list)
+    assignee_by_key = {}
+    for issue in issues:
+        fields = issue.fields
+        status = fields.status.name
+        by_status[status].append(issue)
+        if has_fix_version(issue, current_pi):
+            pi_by_status[status].append(issue)
+            if not has_unlinked_label(issue):
+                linkable_pi_by_status[status].append(issue)
+        updated[issue.key] = parse_jira_datetime(fields.updated)
+        assignee = get_assignee(issue)
+        assignee_by_key[issue.key] = assignee
+        assignees_by_status[status].add(assignee)
+        if fields.issuetype.name != "Epic":
+            by_status_and_assignee[status][assignee].append(issue)
+
+    return IssueIndex(
+        by_status=dict(by_status),
+        pi_by_status=dict(pi_by_status),
+        updated=updated,
+        by_status_and_assignee={
+            status: dict(by_assignee)
+            for status, by_assignee in by_status_and_assignee.items()
+        },
+        assignees_by_status=dict(assignees_by_status),
+        linkable_pi_by_status=dict(linkable_pi_by_status),
+        assignee_by_key=assignee_by_key,
     )
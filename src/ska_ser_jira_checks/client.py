@@ -1,20 +1,63 @@
 """Jira client wrapper."""
 
+import hashlib
+import itertools
+import json
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from types import SimpleNamespace
+from typing import Any, Iterable, Optional
 
 import jira
+from requests.adapters import HTTPAdapter
+
+
+def issue_from_json(data: Any) -> Any:
+    """
+    Convert a decoded Jira JSON response into nested attribute objects.
+
+    This gives the same ``issue.fields.status.name`` style of access as
+    :py:class:`jira.Issue`, at a fraction of the cost of constructing
+    jira-python resources, which matters when loading thousands of issues.
+
+    :param data: Decoded JSON, such as the raw data for one issue.
+
+    :return: The data with every JSON object replaced by a namespace.
+    """
+    if isinstance(data, dict):
+        return SimpleNamespace(**{k: issue_from_json(v) for k, v in data.items()})
+    if isinstance(data, list):
+        return [issue_from_json(item) for item in data]
+    return data
 
 
 class JiraClient:
     """A wrapper around the Jira library for common operations."""
 
-    def __init__(self, url: str = "https://jira.skatelescope.org"):
+    # The subdirectory of the cache directory that holds this client's
+    # cache files; nothing outside it is written or removed.
+    CACHE_SUBDIR = "jira-search"
+
+    def __init__(
+        self, url: str = "https://jira.skatelescope.org", cache_dir: str = None
+    ):
         """Initialize the Jira client.
 
         :param url: The URL of the Jira instance.
+        :param cache_dir: Optional directory in which to cache search results.
+            Cached results are reused for the rest of the day.
         """
         self.url = url
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
         self.session = self._create_session()
+        self._mount_http_adapter()
+        # Issues by key, along with the fields they were fetched with
+        # (None meaning all fields).
+        self._issues: dict[str, tuple[Optional[frozenset[str]], SimpleNamespace]] = {}
 
     def _create_session(self) -> jira.JIRA:
         """
@@ -41,46 +84,298 @@ class JiraClient:
             "or both JIRA_USERNAME and JIRA_PASSWORD environment variables."
         )
 
-    def search_issues(self, jql: str, chunk_size: int = 100) -> list[jira.Issue]:
+    def _mount_http_adapter(self, pool_size: int = 16) -> None:
+        """
+        Give the Jira session a larger connection pool.
+
+        The default pool is smaller than the number of concurrent page requests
+        made by :py:meth:`search_issues`, which forces connections (and their TLS
+        handshakes) to be discarded and re-established.
+
+        Retries are left to the Jira session itself, which already retries
+        throttled and unavailable responses and reports failures as
+        :py:class:`jira.JIRAError`.
+
+        :param pool_size: Number of connections to keep alive per host.
+        """
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+        )
+        # pylint: disable-next=protected-access
+        self.session._session.mount("https://", adapter)
+
+    def search_issues(
+        self,
+        jql: str,
+        fields: list[str] = None,
+        chunk_size: int = 1000,
+        max_workers: int = 8,
+    ) -> list[SimpleNamespace]:
         """
         Search for issues using JQL and handle pagination.
 
+        Issues are returned as :py:func:`issue_from_json` namespaces rather
+        than :py:class:`jira.Issue` objects. They support the same
+        ``issue.fields.status.name`` access, but ``str(issue)`` is not the
+        issue key; use ``issue.key``.
+
+        If a cache directory was provided, results are read from and
+        written to it instead of querying Jira on every run.
+
+        The first page is fetched on its own to learn the total number of
+        matching issues; the remaining pages are then fetched concurrently.
+
+        Some Jira servers silently cap the page size below the requested
+        ``chunk_size``. If the first page comes back short, pagination
+        continues using the page size the server actually returned.
+
         :param jql: JQL search string.
+        :param fields: Optional list of fields to fetch. If None, fetch all fields.
         :param chunk_size: Number of issues to fetch per request.
+        :param max_workers: Maximum number of concurrent page requests.
 
         :return: A list of Jira issues.
         """
-        issues = []
-        i = 0
-        while True:
-            chunk = self.session.search_issues(jql, startAt=i, maxResults=chunk_size)
-            i += chunk_size
-            issues.extend(chunk.iterable)
-            if i >= chunk.total:
-                break
-        return issues
+        cache_key = f"search/{jql}/{fields}"
+        raw_issues = self._load_cache(cache_key)
+        if raw_issues is None:
+            raw_issues = self._fetch_issues(jql, fields, chunk_size, max_workers)
+            self._save_cache(cache_key, raw_issues)
+        return [issue_from_json(raw) for raw in raw_issues]
+
+    def _get_cache_path(self, key: str) -> Optional[str]:
+        """
+        Get the path of the cache file for a cache key.
+
+        Cache files are kept in a subdirectory of :py:attr:`CACHE_SUBDIR`
+        named after today's date, so that cached results expire daily.
+
+        :param key: The cache key.
+
+        :return: The cache file path, or None if caching is disabled.
+        """
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(
+            self.cache_dir,
+            self.CACHE_SUBDIR,
+            date.today().isoformat(),
+            f"{digest}.json",
+        )
+
+    def _prune_cache(self, keep: str) -> None:
+        """
+        Remove the cache subdirectories of earlier days.
+
+        Only the client's own :py:attr:`CACHE_SUBDIR` is searched, so that
+        nothing else in a shared cache directory is ever removed.
+
+        :param keep: The path of the subdirectory to keep.
+        """
+        for entry in os.scandir(os.path.dirname(keep)):
+            if not entry.is_dir() or entry.path == keep:
+                continue
+            try:
+                date.fromisoformat(entry.name)
+            except ValueError:
+                continue
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+    def _load_cache(self, key: str) -> Any:
+        """
+        Load data from the cache.
+
+        :param key: The cache key.
+
+        :return: The cached data, or None if it is not cached.
+        """
+        cache_path = self._get_cache_path(key)
+        if not cache_path or not os.path.exists(cache_path):
+            return None
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
 
-    def get_issue(self, issue_key: str) -> jira.Issue:
+    def _save_cache(self, key: str, data: Any) -> None:
+        """
+        Save data to the cache, if caching is enabled.
+
+        :param key: The cache key.
+        :param data: The JSON-serialisable data to save.
+        """
+        cache_path = self._get_cache_path(key)
+        if not cache_path:
+            return
+        cache_day = os.path.dirname(cache_path)
+        if not os.path.isdir(cache_day):
+            os.makedirs(cache_day, exist_ok=True)
+            self._prune_cache(keep=cache_day)
+        # Write then rename, so that concurrent test processes
+        # never read a partially written cache file.
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+
+    def _fetch_issues(
+        self, jql: str, fields: Optional[list[str]], chunk_size: int, max_workers: int
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch all issues matching a JQL search from Jira.
+
+        :param jql: JQL search string.
+        :param fields: Optional list of fields to fetch.
+        :param chunk_size: Number of issues to fetch per request.
+        :param max_workers: Maximum number of concurrent page requests.
+
+        :return: The raw JSON data of the matching issues.
+        """
+        first = self.session.search_issues(
+            jql, startAt=0, maxResults=chunk_size, fields=fields, json_result=True
+        )
+        total = first["total"]
+        returned = len(first["issues"])
+        if 0 < returned < min(chunk_size, total):
+            print(
+                f"Warning: Jira returned {returned} issues per page "
+                f"(requested {chunk_size}). Using page size {returned}."
+            )
+            chunk_size = returned
+
+        def fetch_page(start: int) -> list[dict[str, Any]]:
+            chunk = self.session.search_issues(
+                jql,
+                startAt=start,
+                maxResults=chunk_size,
+                fields=fields,
+                json_result=True,
+            )
+            return chunk["issues"]
+
+        pages = [first["issues"]]
+        offsets = range(chunk_size, total, chunk_size)
+        if offsets:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pages.extend(executor.map(fetch_page, offsets))
+        return list(itertools.chain.from_iterable(pages))
+
+    def get_issue(self, issue_key: str, fields: list[str] = None) -> SimpleNamespace:
         """
         Get a single issue by key.
 
+        Issues are remembered for the lifetime of the client, so that parent
+        issues looked up by several checks are only fetched once. A
+        remembered issue is only reused if it was fetched with all of the
+        requested fields, for example by :py:meth:`prefetch_issues`.
+
+        As with :py:meth:`search_issues`, the issue is returned as an
+        :py:func:`issue_from_json` namespace, so ``str(issue)`` is not
+        the issue key.
+
         :param issue_key: The issue key (e.g., 'SP-123').
+        :param fields: Optional list of fields to fetch. If None, fetch all fields.
 
         :return: The Jira issue.
         """
-        return self.session.issue(issue_key)
+        issue = self._get_remembered_issue(issue_key, fields)
+        if issue is None:
+            issue = issue_from_json(
+                self.session.issue(
+                    issue_key, fields=",".join(fields) if fields else None
+                ).raw
+            )
+            self._remember_issue(issue, fields)
+        return issue
+
+    def _get_remembered_issue(
+        self, issue_key: str, fields: Optional[list[str]]
+    ) -> Optional[SimpleNamespace]:
+        """
+        Get a remembered issue, if it has all of the requested fields.
+
+        :param issue_key: The issue key.
+        :param fields: The fields needed, or None for all fields.
 
-    def get_team_members(self, project: str) -> set[str]:
+        :return: The issue, or None if it must be fetched.
+        """
+        fetched_fields, issue = self._issues.get(issue_key, (frozenset(), None))
+        if fetched_fields is None or (fields and fetched_fields.issuperset(fields)):
+            return issue
+        return None
+
+    def _remember_issue(
+        self, issue: SimpleNamespace, fields: Optional[list[str]]
+    ) -> None:
+        """
+        Remember an issue for later :py:meth:`get_issue` calls.
+
+        :param issue: The issue.
+        :param fields: The fields it was fetched with, or None for all fields.
+        """
+        self._issues[issue.key] = (frozenset(fields) if fields else None, issue)
+
+    def prefetch_issues(
+        self,
+        issue_keys: Iterable[str],
+        fields: list[str],
+        batch_size: int = 500,
+        max_workers: int = 8,
+    ) -> None:
+        """
+        Fetch several issues by key, so later :py:meth:`get_issue` calls are free.
+
+        Issues are fetched with concurrent ``key in (...)`` searches of up to
+        ``batch_size`` keys, rather than one request per issue. If a batch
+        cannot be searched (for example because one of the issues has been
+        deleted), its issues are left to be fetched individually.
+
+        :param issue_keys: The keys of the issues to fetch.
+        :param fields: The fields that later callers of
+            :py:meth:`get_issue` will need.
+        :param batch_size: Maximum number of keys per search.
+        :param max_workers: Maximum number of concurrent searches.
+        """
+        keys = sorted(
+            key
+            for key in set(issue_keys)
+            if self._get_remembered_issue(key, fields) is None
+        )
+        batches = [keys[i : i + batch_size] for i in range(0, len(keys), batch_size)]
+        if not batches:
+            return
+
+        def fetch_batch(batch: list[str]) -> list[SimpleNamespace]:
+            try:
+                return self.search_issues(f"key in ({','.join(batch)})", fields=fields)
+            except jira.JIRAError as err:
+                print(f"Warning: could not prefetch issues: {err.text}")
+                return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for issues in executor.map(fetch_batch, batches):
+                for issue in issues:
+                    self._remember_issue(issue, fields)
+
+    def get_team_members(self, project: str) -> frozenset[str]:
         """
         Get the set of team members (Developers) for a project.
 
+        Looking up the team takes two requests (the project's roles,
+        then the Developers role), so the result is cached along with
+        search results.
+
         :param project: the project name.
 
         :return: the set of team member usernames.
         """
-        roles = self.session.project_roles(project=project)
-        developer_id = roles["Developers"]["id"]
-        team_members = self.session.project_role(
-            project=project, id=developer_id
-        ).actors
-        return {member.name for member in team_members}
+        cache_key = f"team/{project}"
+        names = self._load_cache(cache_key)
+        if names is None:
+            roles = self.session.project_roles(project=project)
+            developer_id = roles["Developers"]["id"]
+            team_members = self.session.project_role(
+                project=project, id=developer_id
+            ).actors
+            names = sorted(member.name for member in team_members)
+            self._save_cache(cache_key, names)
+        return frozenset(names)
@@ -1,6 +1,54 @@
 """Constants for Jira checks."""
 
-UNLINKED_LABELS = {"innovation", "overhead", "team_backlog", "dependency"}
+UNLINKED_LABELS = frozenset({"innovation", "overhead", "team_backlog", "dependency"})
+
+# How an issue link is classified, keyed by the direction of the link,
+# the link type and the project of the linked issue.
+# "parent" links are features (SP) or objectives (SPO) that an issue belongs to;
+# the others are links to the wrong kind of issue.
+LINK_CATEGORIES = {
+    ("outward", "Relates", "SPO"): "parent",
+    ("outward", "Relates", "SP"): "related_feature",
+    ("inward", "Parent/Child", "SP"): "parent",
+    ("inward", "Parent/Child", "SPO"): "objective_child",
+    ("inward", "Relates", "SPO"): "parent",
+    ("inward", "Relates", "SP"): "related_feature",
+}
+
+# Issue fields read by the project checks. Searches request only these,
+# so any field newly used by a check must be added here.
+PROJECT_ISSUE_FIELDS = [
+    "summary",
+    "status",
+    "assignee",
+    "creator",
+    "updated",
+    "issuetype",
+    "labels",
+    "fixVersions",
+    "description",
+    "issuelinks",
+    "customfield_10002",  # Story points
+    "customfield_10006",  # Epic link
+    "customfield_11949",  # Outcomes
+    "customfield_13300",  # Development summary
+]
+
+# Issue fields read by the SKB checks.
+SKB_ISSUE_FIELDS = [
+    "summary",
+    "status",
+    "assignee",
+    "creator",
+    "updated",
+    "priority",
+    "components",
+    "labels",
+    "issuelinks",
+]
+
+# Fields read from the parents (features and objectives) of issues and SKBs.
+PARENT_ISSUE_FIELDS = ["status", "fixVersions"]
 
 STATUSES = [
     "BACKLOG",
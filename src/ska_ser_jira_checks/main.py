@@ -5,18 +5,28 @@ import importlib
 import inspect
 import os
 import pkgutil
-from collections import defaultdict
-from datetime import date
-from typing import Any, Dict, List, Type
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, List, Type
 
+import jira
 import yaml
 
 import ska_ser_jira_checks.checks.project
 import ska_ser_jira_checks.checks.skb
-from ska_ser_jira_checks.checks.utils import get_issues_by_status
+from ska_ser_jira_checks.checks.utils import (
+    classify_issue_links,
+    index_issues,
+    parse_jira_datetime,
+)
 from ska_ser_jira_checks.client import JiraClient
+from ska_ser_jira_checks.constants import (
+    PARENT_ISSUE_FIELDS,
+    PROJECT_ISSUE_FIELDS,
+    SKB_ISSUE_FIELDS,
+)
 from ska_ser_jira_checks.models import (
     Check,
+    IssueLinks,
     ProjectCheckContext,
     Report,
     SkbCheckContext,
@@ -32,42 +42,41 @@ def get_current_pi() -> int:
     return delta.days // 91
 
 
-def get_issue_parentage(
-    issues: List[Any], project: str
-) -> Dict[str, List[tuple[str, str]]]:
-    """Get the parents of each issue.
+def analyse_issue_links(issues: List[Any], project: str) -> IssueLinks:
+    """Work out each issue's parents and its misdirected links in one pass.
 
     :param issues: The list of issues to process.
     :param project: The project key.
 
-    :return: A dictionary mapping issue keys to a list of parent (type, key) tuples.
+    :return: The parents of each issue, as a dictionary mapping issue keys to a
+        list of parent (type, key) tuples, along with the issues that are a
+        child of an objective or relate to a feature.
     """
-    parentage = defaultdict(list)
+    project_prefix = f"{project}-"
+    parentage = {}
+    objective_children = []
+    related_features = []
     for issue in issues:
-        epic = issue.fields.customfield_10006
-        if epic is not None and epic.startswith(f"{project}-"):
-            parentage[issue.key].append(("EPIC", epic))
-
-        for issuelink in issue.fields.issuelinks:
-            link_type = issuelink.type.name
-            if hasattr(issuelink, "outwardIssue"):
-                parent = str(issuelink.outwardIssue)
-                if link_type != "Relates" or not parent.startswith("SPO-"):
-                    continue
-            elif hasattr(issuelink, "inwardIssue"):
-                parent = str(issuelink.inwardIssue)
-                if link_type == "Parent/Child":
-                    if not parent.startswith("SP-"):
-                        continue
-                elif link_type == "Relates":
-                    if not parent.startswith("SPO-"):
-                        continue
-                else:
-                    continue
-            else:
-                continue
-            parentage[issue.key].append((issuelink.type.name, parent))
-    return parentage
+        parents = []
+        fields = issue.fields
+        epic = fields.customfield_10006
+        if epic is not None and epic.startswith(project_prefix):
+            parents.append(("EPIC", epic))
+
+        for category, link_type, target in classify_issue_links(issue):
+            if category == "parent":
+                parents.append((link_type, target))
+            elif category == "objective_child":
+                objective_children.append((issue, target))
+            elif category == "related_feature":
+                related_features.append((issue, target))
+        if parents:
+            parentage[issue.key] = parents
+    return IssueLinks(
+        parentage=parentage,
+        objective_children=objective_children,
+        related_features=related_features,
+    )
 
 
 def discover_checks(package: Any) -> List[Type[Check]]:
@@ -89,6 +98,55 @@ def discover_checks(package: Any) -> List[Type[Check]]:
     return check_classes
 
 
+def run_package_checks(package: Any, report: Report, context: Any) -> None:
+    """
+    Run every check discovered in a package against a single context.
+
+    :param package: The package to search for checks.
+    :param report: The report to add violations to.
+    :param context: The context to run the checks against.
+    """
+    for check_class in discover_checks(package):
+        checker = check_class()
+        for params in checker.parametrization:
+            checker.check(report, context, **params)
+
+
+def build_jql(project: str, start_date: str = None, users: Iterable[str] = None) -> str:
+    """
+    Build the JQL search string for all issues in a project.
+
+    Results are ordered by key, so that pages fetched concurrently
+    don't overlap or leave gaps, and results are reproducible.
+
+    :param project: The Jira project key.
+    :param start_date: Optional start date for issues (YYYY-MM-DD).
+    :param users: Optional usernames; if given, only issues created by
+        or assigned to one of these users are matched.
+
+    :return: The JQL search string.
+    """
+    jql = f"project = {project}"
+    if start_date:
+        jql += f" AND createdDate > {start_date}"
+    if users:
+        names = ", ".join(quote_jql(user) for user in sorted(users))
+        jql += f" AND (assignee in ({names}) OR creator in ({names}))"
+    return f"{jql} ORDER BY key"
+
+
+def quote_jql(value: str) -> str:
+    """
+    Quote a value for use in a JQL query.
+
+    :param value: The value to quote.
+
+    :return: The value in double quotes, with quotes and backslashes escaped.
+    """
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
 class NoAliasDumper(yaml.SafeDumper):
     """YAML dumper that doesn't use aliases."""
 
@@ -164,82 +222,123 @@ def load_overrides(file_path: str = None) -> Dict[str, List[str]]:
 
 # pylint: disable=too-many-locals
 def run_checks(
-    project: str, start_date: str = None, overrides: Dict[str, Any] = None
+    project: str,
+    start_date: str = None,
+    overrides: Dict[str, Any] = None,
+    cache_dir: str = None,
 ) -> Dict[str, Report]:
     """Run all Jira checks and produce two reports.
 
     :param project: The Jira project key.
     :param start_date: Optional start date for issues (YYYY-MM-DD).
     :param overrides: Optional dictionary of violation overrides.
+    :param cache_dir: Optional directory in which to cache Jira search results.
 
     :return: A dictionary of Report objects keyed by project name.
     """
-    client = JiraClient()
+    client = JiraClient(cache_dir=cache_dir)
     pi = get_current_pi()
+    # All age checks measure from the same moment.
+    now = datetime.now(timezone.utc)
     overrides = overrides or {}
 
     project_overrides = overrides.get(project, {})
     skb_overrides = overrides.get("SKB", {})
 
     # Fetch project issues
-    jql = f"project = {project}"
-    if start_date:
-        jql += f" AND createdDate > {start_date}"
-    all_issues = client.search_issues(jql)
-    issues_by_status = get_issues_by_status(all_issues)
+    all_issues = client.search_issues(
+        build_jql(project, start_date), fields=PROJECT_ISSUE_FIELDS
+    )
+    index = index_issues(all_issues, pi)
 
     # Fetch team members
     try:
         team = client.get_team_members(project)
     except Exception:  # pylint: disable=broad-exception-caught
         print("Warning: Could not fetch team members. Skipping team-based checks.")
-        team = set()
+        team = frozenset()
 
-    # Pre-calculate parentage
-    parentage = get_issue_parentage(all_issues, project)
+    # Pre-calculate parentage and misdirected links
+    links = analyse_issue_links(all_issues, project)
+    client.prefetch_issues(
+        (parent for parents in links.parentage.values() for _, parent in parents),
+        fields=PARENT_ISSUE_FIELDS,
+    )
 
     # Project checks
     project_report = Report(project=project, pi=pi, overrides=project_overrides)
     project_context = ProjectCheckContext(
-        issues_by_status=issues_by_status,
+        index=index,
+        links=links,
         pi=pi,
         team=team,
         project=project,
         client=client,
-        parentage=parentage,
+        now=now,
+    )
+    run_package_checks(
+        ska_ser_jira_checks.checks.project, project_report, project_context
     )
-    project_checks = discover_checks(ska_ser_jira_checks.checks.project)
-    for check_class in project_checks:
-        checker = check_class()
-        for params in checker.parametrization:
-            checker.check(project_report, project_context, **params)
 
     # SKB Checks
     skb_report = Report(project="SKB", pi=pi, overrides=skb_overrides)
-    jql_skb = "project = SKB"
-    if start_date:
-        jql_skb += f" AND createdDate > {start_date}"
-    skb_issues = client.search_issues(jql_skb)
+    # Only SKBs created by or assigned to the team are checked,
+    # so there is no need to fetch the rest.
+    skb_issues = []
+    if team:
+        try:
+            skb_issues = client.search_issues(
+                build_jql("SKB", start_date, users=team), fields=SKB_ISSUE_FIELDS
+            )
+        except jira.JIRAError as err:
+            # Jira rejects the query if the team includes a group or a
+            # user it no longer knows; the team filter below still applies.
+            print(f"Warning: could not search SKBs by team: {err.text}")
+            skb_issues = client.search_issues(
+                build_jql("SKB", start_date), fields=SKB_ISSUE_FIELDS
+            )
 
     team_created_skbs = []
     team_assigned_skbs = []
+    created_by_status = {}
+    assigned_by_status = {}
+    skb_updated = {}
+    skb_parentage = {}
     for issue in skb_issues:
-        if team and issue.fields.creator.name in team:
+        fields = issue.fields
+        status = fields.status.name
+        if fields.creator.name in team:
             team_created_skbs.append(issue)
-        if team and issue.fields.assignee and issue.fields.assignee.name in team:
+            created_by_status.setdefault(status, []).append(issue)
+        assignee = fields.assignee
+        if assignee and assignee.name in team:
             team_assigned_skbs.append(issue)
+            assigned_by_status.setdefault(status, []).append(issue)
+            skb_updated[issue.key] = parse_jira_datetime(fields.updated)
+            parents = [
+                (link_type, target)
+                for category, link_type, target in classify_issue_links(issue)
+                if category == "parent"
+            ]
+            if parents:
+                skb_parentage[issue.key] = parents
+    client.prefetch_issues(
+        (parent for parents in skb_parentage.values() for _, parent in parents),
+        fields=PARENT_ISSUE_FIELDS,
+    )
 
     skb_context = SkbCheckContext(
         team_created_skbs=team_created_skbs,
         team_assigned_skbs=team_assigned_skbs,
         pi=pi,
         client=client,
+        updated=skb_updated,
+        parentage=skb_parentage,
+        team_created_skbs_by_status=created_by_status,
+        team_assigned_skbs_by_status=assigned_by_status,
+        now=now,
     )
-    skb_checks = discover_checks(ska_ser_jira_checks.checks.skb)
-    for check_class in skb_checks:
-        checker = check_class()
-        for params in checker.parametrization:
-            checker.check(skb_report, skb_context, **params)
+    run_package_checks(ska_ser_jira_checks.checks.skb, skb_report, skb_context)
 
     return {project: project_report, "SKB": skb_report}
 
@@ -267,6 +366,11 @@ def main():
         default=os.environ.get("JIRA_OVERRIDES_FILE"),
         help="Path to YAML file containing violation overrides.",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.environ.get("JIRA_CACHE_DIR"),
+        help="Directory in which to cache Jira search results for the day.",
+    )
 
     args = parser.parse_args()
 
@@ -278,7 +382,9 @@ def main():
         num_overrides = sum(len(v) for v in overrides.values() if isinstance(v, dict))
         print(f"Loaded {num_overrides} overrides from {args.overrides}.")
 
-    reports = run_checks(args.project, args.start_date, overrides)
+    reports = run_checks(
+        args.project, args.start_date, overrides, cache_dir=args.cache_dir
+    )
 
     project_output = os.path.join(args.output_dir, f"{args.project}-report.yaml")
     save_report_to_yaml(reports[args.project], project_output)
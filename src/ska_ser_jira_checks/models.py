@@ -2,6 +2,7 @@
 
 from collections import defaultdict
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any, Dict, List
 
 
@@ -53,18 +54,42 @@ class Report:
         )
 
 
+@dataclass
+class IssueIndex:
+    """Lookups over a list of issues, built in a single pass."""
+
+    by_status: Dict[str, List[Any]]
+    pi_by_status: Dict[str, List[Any]]
+    updated: Dict[str, datetime]
+    by_status_and_assignee: Dict[str, Dict[str, List[Any]]]
+    assignees_by_status: Dict[str, set[str]]
+    linkable_pi_by_status: Dict[str, List[Any]]
+    assignee_by_key: Dict[str, str]
+
+
+@dataclass
+class IssueLinks:
+    """The parents and misdirected links of a list of issues."""
+
+    parentage: Dict[str, List[tuple[str, str]]]
+    objective_children: List[tuple[Any, str]]
+    related_features: List[tuple[Any, str]]
+
+
 @dataclass
 class ProjectCheckContext:
     """Context for running project-specific Jira checks."""
 
-    issues_by_status: Dict[str, List[Any]]
+    index: IssueIndex
+    links: IssueLinks
     pi: int
-    team: set[str]
+    team: frozenset[str]
     project: str
     client: Any
-    parentage: Dict[str, List[tuple[str, str]]]
+    now: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+# pylint: disable=too-many-instance-attributes
 @dataclass
 class SkbCheckContext:
     """Context for running SKB-specific Jira checks."""
@@ -73,6 +98,11 @@ class SkbCheckContext:
     team_assigned_skbs: List[Any]
     pi: int
     client: Any
+    updated: Dict[str, datetime]
+    parentage: Dict[str, List[tuple[str, str]]]
+    team_created_skbs_by_status: Dict[str, List[Any]]
+    team_assigned_skbs_by_status: Dict[str, List[Any]]
+    now: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 # pylint: disable=too-few-public-methods
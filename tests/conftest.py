@@ -8,11 +8,29 @@ import pytest
 from ska_ser_jira_checks.main import load_overrides, run_checks
 
 
+def pytest_addoption(parser):
+    """
+    Add command line options.
+
+    :param parser: the pytest command line parser.
+    """
+    parser.addoption(
+        "--no-jira-cache",
+        action="store_true",
+        default=False,
+        help="Fetch issues from Jira even if they are cached from an earlier run.",
+    )
+
+
 @pytest.fixture(scope="session")
-def all_reports():
+def all_reports(request):
     """
     Generate all reports by running all checks.
 
+    Jira search results are cached in the pytest cache directory for the
+    rest of the day, unless the ``--no-jira-cache`` option is given.
+
+    :param request: the pytest request object.
     :return: a dictionary of reports keyed by project.
     """
     project = os.environ.get("JIRA_PROJECT")
@@ -23,7 +41,12 @@ def all_reports():
 
     overrides_file = os.environ.get("JIRA_OVERRIDES_FILE")
     overrides = load_overrides(overrides_file)
-    return run_checks(project, start_date, overrides=overrides)
+    # The pytest cache is unavailable under "-p no:cacheprovider"
+    cache = getattr(request.config, "cache", None)
+    cache_dir = None
+    if cache is not None and not request.config.getoption("--no-jira-cache"):
+        cache_dir = str(cache.mkdir("jira"))
+    return run_checks(project, start_date, overrides=overrides, cache_dir=cache_dir)
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,283 @@
+"""Offline tests for the Jira client, using a stub Jira session."""
+
+# pylint: disable=redefined-outer-name,invalid-name
+import os
+from types import SimpleNamespace
+
+import jira
+import pytest
+
+from ska_ser_jira_checks.client import JiraClient, issue_from_json
+
+
+def raw_issue(number):
+    """
+    Make the raw JSON data for an issue.
+
+    :param number: The issue number.
+    :return: The raw issue data.
+    """
+    return {
+        "key": f"SP-{number}",
+        "fields": {
+            "status": {"name": "Done"},
+            "fixVersions": [{"name": "PI20"}],
+            "summary": f"Issue {number}",
+        },
+    }
+
+
+class StubSession:
+    """A stand-in for a jira.JIRA session, serving a fixed list of issues."""
+
+    def __init__(self, issues, page_cap=None):
+        """
+        Create the stub session.
+
+        :param issues: The raw issues to serve.
+        :param page_cap: Optional server-side limit on the page size.
+        """
+        self.issues = issues
+        self.page_cap = page_cap
+        self.searches = []
+        self.fetched = []
+
+    def search_issues(
+        self, jql, startAt=0, maxResults=50, fields=None, json_result=False
+    ):
+        """
+        Search the issues, returning one page of raw JSON results.
+
+        :param jql: The JQL search string.
+        :param startAt: The index of the first result.
+        :param maxResults: The requested page size.
+        :param fields: The fields to return.
+        :param json_result: Must be True; the client always asks for JSON.
+        :return: The page of results and the total number of matches.
+        :raises JIRAError: if the search includes an unknown issue key.
+        """
+        assert json_result
+        self.searches.append((jql, startAt, maxResults))
+        issues = self.issues
+        if jql.startswith("key in ("):
+            keys = jql[len("key in (") : -1].split(",")
+            by_key = {issue["key"]: issue for issue in issues}
+            if not set(keys).issubset(by_key):
+                raise jira.JIRAError(status_code=400, text="Unknown issue")
+            issues = [by_key[key] for key in keys]
+        if self.page_cap:
+            maxResults = min(maxResults, self.page_cap)
+        return {
+            "issues": [project_fields(issue, fields) for issue in issues][
+                startAt : startAt + maxResults
+            ],
+            "total": len(issues),
+        }
+
+    def issue(self, key, fields=None):
+        """
+        Get a single issue.
+
+        :param key: The issue key.
+        :param fields: Comma-separated fields to return, or None for all.
+        :return: An object holding the raw issue data.
+        """
+        self.fetched.append((key, fields))
+        raw = next(issue for issue in self.issues if issue["key"] == key)
+        return SimpleNamespace(raw=project_fields(raw, fields))
+
+
+def project_fields(issue, fields):
+    """
+    Keep only some fields of a raw issue, as Jira does.
+
+    :param issue: The raw issue.
+    :param fields: The fields to keep, as a list or comma-separated string,
+        or None for all fields.
+    :return: The raw issue with only the requested fields.
+    """
+    if fields is None:
+        return issue
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    return {
+        "key": issue["key"],
+        "fields": {k: v for k, v in issue["fields"].items() if k in fields},
+    }
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """
+    Make a factory for Jira clients that use a stub session.
+
+    :param monkeypatch: The pytest monkeypatch fixture.
+    :return: A function taking a stub session and optional cache directory.
+    """
+
+    def factory(session, cache_dir=None):
+        monkeypatch.setattr(JiraClient, "_create_session", lambda self: session)
+        monkeypatch.setattr(JiraClient, "_mount_http_adapter", lambda self: None)
+        return JiraClient(cache_dir=cache_dir)
+
+    return factory
+
+
+def test_issue_from_json():
+    """Test that raw JSON becomes nested namespaces."""
+    issue = issue_from_json(raw_issue(1))
+    assert issue.key == "SP-1"
+    assert issue.fields.status.name == "Done"
+    assert [v.name for v in issue.fields.fixVersions] == ["PI20"]
+    assert issue.fields.summary == "Issue 1"
+
+
+def test_search_issues_paginates(make_client):
+    """
+    Test that every page of a search is fetched, in order.
+
+    :param make_client: The client factory.
+    """
+    session = StubSession([raw_issue(n) for n in range(25)])
+    client = make_client(session)
+
+    issues = client.search_issues("project = SP", chunk_size=10)
+
+    assert [issue.key for issue in issues] == [f"SP-{n}" for n in range(25)]
+    assert sorted(start for _, start, _ in session.searches) == [0, 10, 20]
+
+
+def test_search_issues_follows_page_size_cap(make_client, capsys):
+    """
+    Test that pagination uses the server's page size if it is smaller.
+
+    :param make_client: The client factory.
+    :param capsys: The pytest output capture fixture.
+    """
+    session = StubSession([raw_issue(n) for n in range(25)], page_cap=4)
+    client = make_client(session)
+
+    issues = client.search_issues("project = SP", chunk_size=10)
+
+    assert [issue.key for issue in issues] == [f"SP-{n}" for n in range(25)]
+    assert sorted(start for _, start, _ in session.searches) == list(range(0, 25, 4))
+    assert "Using page size 4" in capsys.readouterr().out
+
+
+def test_search_issues_empty(make_client):
+    """
+    Test a search that matches nothing.
+
+    :param make_client: The client factory.
+    """
+    session = StubSession([])
+    client = make_client(session)
+
+    assert not client.search_issues("project = SP")
+    assert len(session.searches) == 1
+
+
+def test_search_cache_round_trip(make_client, tmp_path):
+    """
+    Test that a cached search is served from disk by a new client.
+
+    :param make_client: The client factory.
+    :param tmp_path: A temporary directory.
+    """
+    cache_dir = str(tmp_path / "cache")
+    session = StubSession([raw_issue(n) for n in range(3)])
+    first = make_client(session, cache_dir).search_issues("project = SP")
+
+    offline = StubSession([])
+    second = make_client(offline, cache_dir).search_issues("project = SP")
+
+    assert second == first
+    assert not offline.searches
+    assert make_client(offline, cache_dir).search_issues("project = SPO") == []
+    assert len(offline.searches) == 1
+
+
+def test_cache_prunes_earlier_days(make_client, tmp_path):
+    """
+    Test that starting a new day's cache removes earlier days' caches.
+
+    :param make_client: The client factory.
+    :param tmp_path: A temporary directory.
+    """
+    cache_root = tmp_path / JiraClient.CACHE_SUBDIR
+    (cache_root / "2000-01-01").mkdir(parents=True)
+    (cache_root / "2000-01-01" / "stale.json").write_text("[]")
+    (cache_root / "other").mkdir()
+
+    make_client(StubSession([]), str(tmp_path)).search_issues("project = SP")
+
+    assert not (cache_root / "2000-01-01").exists()
+    assert (cache_root / "other").exists()
+    assert len(os.listdir(cache_root)) == 2
+
+
+def test_cache_keeps_directories_it_did_not_create(make_client, tmp_path):
+    """
+    Test that date-named directories outside the client's own cache are kept.
+
+    :param make_client: The client factory.
+    :param tmp_path: A temporary directory, standing in for a shared one.
+    """
+    (tmp_path / "2000-01-01").mkdir()
+    (tmp_path / "2000-01-01" / "report.yaml").write_text("")
+
+    make_client(StubSession([]), str(tmp_path)).search_issues("project = SP")
+
+    assert (tmp_path / "2000-01-01" / "report.yaml").exists()
+    assert sorted(os.listdir(tmp_path)) == ["2000-01-01", JiraClient.CACHE_SUBDIR]
+
+
+def test_prefetched_issue_is_reused(make_client):
+    """
+    Test that get_issue reuses a prefetched issue with the fields it needs.
+
+    :param make_client: The client factory.
+    """
+    session = StubSession([raw_issue(n) for n in range(3)])
+    client = make_client(session)
+
+    client.prefetch_issues(["SP-1", "SP-2"], fields=["status", "fixVersions"])
+    issue = client.get_issue("SP-1", ["status"])
+
+    assert issue.fields.status.name == "Done"
+    assert not session.fetched
+
+
+def test_prefetched_issue_is_refetched_for_other_fields(make_client):
+    """
+    Test that get_issue fetches an issue again if it needs more fields.
+
+    :param make_client: The client factory.
+    """
+    session = StubSession([raw_issue(n) for n in range(3)])
+    client = make_client(session)
+
+    client.prefetch_issues(["SP-1"], fields=["status", "fixVersions"])
+    issue = client.get_issue("SP-1")
+
+    assert issue.fields.summary == "Issue 1"
+    assert session.fetched == [("SP-1", None)]
+    assert client.get_issue("SP-1", ["status"]) is issue
+
+
+def test_failed_prefetch_falls_back_to_get_issue(make_client, capsys):
+    """
+    Test that issues in a failed prefetch batch are fetched individually.
+
+    :param make_client: The client factory.
+    :param capsys: The pytest output capture fixture.
+    """
+    session = StubSession([raw_issue(n) for n in range(3)])
+    client = make_client(session)
+
+    client.prefetch_issues(["SP-1", "SP-99"], fields=["status"])
+    issue = client.get_issue("SP-1", ["status"])
+
+    assert "could not prefetch issues" in capsys.readouterr().out
+    assert issue.fields.status.name == "Done"
+    assert session.fetched == [("SP-1", "status")]
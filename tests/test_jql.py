@@ -0,0 +1,42 @@
+"""Tests for building JQL search strings."""
+
+from ska_ser_jira_checks.main import build_jql, quote_jql
+
+
+def test_quote_jql_plain():
+    """Test that plain values are wrapped in double quotes."""
+    assert quote_jql("A.Hill") == '"A.Hill"'
+
+
+def test_quote_jql_escapes():
+    """Test that quotes and backslashes are escaped."""
+    assert quote_jql('a"b') == '"a\\"b"'
+    assert quote_jql("a\\b") == '"a\\\\b"'
+    assert quote_jql('a\\"') == '"a\\\\\\""'
+
+
+def test_build_jql_project_only():
+    """Test the JQL for all issues in a project."""
+    assert build_jql("SKB") == "project = SKB ORDER BY key"
+
+
+def test_build_jql_start_date():
+    """Test the JQL for issues created after a start date."""
+    assert (
+        build_jql("SKB", "2024-01-31")
+        == "project = SKB AND createdDate > 2024-01-31 ORDER BY key"
+    )
+
+
+def test_build_jql_users():
+    """Test that users are quoted, sorted and matched as assignee or creator."""
+    assert build_jql("SKB", "2024-01-31", users={"bob", 'a"c'}) == (
+        "project = SKB AND createdDate > 2024-01-31"
+        ' AND (assignee in ("a\\"c", "bob") OR creator in ("a\\"c", "bob"))'
+        " ORDER BY key"
+    )
+
+
+def test_build_jql_no_users():
+    """Test that an empty set of users adds no user filter."""
+    assert build_jql("SKB", users=frozenset()) == "project = SKB ORDER BY key"
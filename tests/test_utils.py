@@ -0,0 +1,191 @@
+"""Offline tests for the check utility functions."""
+
+import datetime
+
+import pytest
+
+from ska_ser_jira_checks.checks.utils import (
+    classify_issue_links,
+    get_dev_field,
+    index_issues,
+    parse_jira_datetime,
+)
+from ska_ser_jira_checks.client import issue_from_json
+
+
+def make_issue(key, **fields):
+    """
+    Make a Jira issue in the form returned by the client.
+
+    :param key: The issue key.
+    :param fields: The raw issue fields.
+    :return: The issue.
+    """
+    return issue_from_json({"key": key, "fields": fields})
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (
+            "2024-01-31T09:15:00.000+0000",
+            datetime.datetime(2024, 1, 31, 9, 15, tzinfo=datetime.timezone.utc),
+        ),
+        (
+            "2024-01-31T09:15:00.123-0530",
+            datetime.datetime(
+                2024,
+                1,
+                31,
+                9,
+                15,
+                0,
+                123000,
+                tzinfo=datetime.timezone(-datetime.timedelta(hours=5, minutes=30)),
+            ),
+        ),
+    ],
+)
+def test_parse_jira_datetime(value, expected):
+    """
+    Test that Jira timestamps are parsed with their UTC offset.
+
+    :param value: The Jira timestamp.
+    :param expected: The expected datetime.
+    """
+    parsed = parse_jira_datetime(value)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+def test_parse_jira_datetime_orders_across_offsets():
+    """Test that timestamps with different offsets compare correctly."""
+    earlier = parse_jira_datetime("2024-01-31T09:15:00.000+0000")
+    later = parse_jira_datetime("2024-01-31T09:15:00.000-0530")
+    assert later - earlier == datetime.timedelta(hours=5, minutes=30)
+
+
+@pytest.mark.parametrize(
+    "direction, link_type, target, expected",
+    [
+        ("outwardIssue", "Relates", "SPO-1", ("parent", "Relates", "SPO-1")),
+        ("outwardIssue", "Relates", "SP-2", ("related_feature", "Relates", "SP-2")),
+        (
+            "inwardIssue",
+            "Parent/Child",
+            "SP-3",
+            ("parent", "Parent/Child", "SP-3"),
+        ),
+        (
+            "inwardIssue",
+            "Parent/Child",
+            "SPO-4",
+            ("objective_child", "Parent/Child", "SPO-4"),
+        ),
+        ("inwardIssue", "Relates", "SPO-5", ("parent", "Relates", "SPO-5")),
+        ("inwardIssue", "Relates", "SP-6", ("related_feature", "Relates", "SP-6")),
+        ("outwardIssue", "Parent/Child", "SP-7", None),
+        ("inwardIssue", "Blocks", "SP-8", None),
+        ("inwardIssue", "Relates", "SPX-9", None),
+        ("inwardIssue", "Relates", "LOW-10", None),
+    ],
+)
+def test_classify_issue_links(direction, link_type, target, expected):
+    """
+    Test that each link is classified according to LINK_CATEGORIES.
+
+    :param direction: The link attribute holding the linked issue.
+    :param link_type: The link type name.
+    :param target: The linked issue key.
+    :param expected: The expected classification, or None if uncategorised.
+    """
+    issue = make_issue(
+        "LOW-1",
+        issuelinks=[{"type": {"name": link_type}, direction: {"key": target}}],
+    )
+    assert list(classify_issue_links(issue)) == ([expected] if expected else [])
+
+
+def test_classify_issue_links_keeps_order():
+    """Test that several links are classified in order."""
+    issue = make_issue(
+        "LOW-1",
+        issuelinks=[
+            {"type": {"name": "Relates"}, "inwardIssue": {"key": "SP-1"}},
+            {"type": {"name": "Blocks"}, "outwardIssue": {"key": "SP-2"}},
+            {"type": {"name": "Relates"}, "outwardIssue": {"key": "SPO-3"}},
+        ],
+    )
+    assert list(classify_issue_links(issue)) == [
+        ("related_feature", "Relates", "SP-1"),
+        ("parent", "Relates", "SPO-3"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (None, {}),
+        ("junk", {}),
+        ('{summaryBean=x, devSummaryJson={"cachedValue": {"a": 1}}}', {"a": 1}),
+    ],
+)
+def test_get_dev_field(raw, expected):
+    """
+    Test that the development summary JSON is extracted.
+
+    :param raw: The raw development field.
+    :param expected: The expected cachedValue, or {} if there is none.
+    """
+    dev_field = get_dev_field(make_issue("LOW-1", customfield_13300=raw))
+    assert dev_field.get("cachedValue", {}) == expected
+
+
+def test_index_issues():
+    """Test that issues are indexed by status, PI, assignee and update time."""
+    updated = "2024-01-31T09:15:00.000+0000"
+    story = make_issue(
+        "LOW-1",
+        status={"name": "In Progress"},
+        fixVersions=[{"name": "PI20"}],
+        labels=[],
+        updated=updated,
+        assignee={"name": "alice"},
+        creator={"name": "bob"},
+        issuetype={"name": "Story"},
+    )
+    unlinked = make_issue(
+        "LOW-2",
+        status={"name": "In Progress"},
+        fixVersions=[{"name": "PI20"}],
+        labels=["Team_Backlog"],
+        updated=updated,
+        assignee=None,
+        creator={"name": "bob"},
+        issuetype={"name": "Story"},
+    )
+    epic = make_issue(
+        "LOW-3",
+        status={"name": "To Do"},
+        fixVersions=[{"name": "PI19"}],
+        labels=[],
+        updated=updated,
+        assignee={"name": "carol"},
+        creator={"name": "bob"},
+        issuetype={"name": "Epic"},
+    )
+
+    index = index_issues([story, unlinked, epic], 20)
+
+    assert index.by_status == {"In Progress": [story, unlinked], "To Do": [epic]}
+    assert index.pi_by_status == {"In Progress": [story, unlinked]}
+    assert index.linkable_pi_by_status == {"In Progress": [story]}
+    assert index.assignee_by_key == {"LOW-1": "alice", "LOW-2": "bob", "LOW-3": "carol"}
+    assert index.assignees_by_status == {
+        "In Progress": {"alice", "bob"},
+        "To Do": {"carol"},
+    }
+    assert index.by_status_and_assignee == {
+        "In Progress": {"alice": [story], "bob": [unlinked]}
+    }
+    assert index.updated["LOW-1"] == parse_jira_datetime(updated)